@@ -1,7 +1,7 @@
-import pickle
 import time
 import random
 from player import Player
+from word_set import WordSet, current_word_set
 
 class Game:
     """
@@ -11,6 +11,10 @@ class Game:
     ----------
     players : list
         list of Player objects reprsenting players
+    word_set : WordSet
+        version of dictionary and patterns this game is using
+    difficulty : int
+        difficulty of game (1 = easy, 2 = med, 3 = hard, 4 = practice)
     dictionary : dictionary
         dictionary of starting kana to all valid words starting with kana
     patterns : list
@@ -39,28 +43,24 @@ class Game:
         stores winner of game if winner exists
     queue : List
         stores players who joined after game started
+    clock : callable
+        returns the current time in seconds (swapped for a virtual clock in simulate.py)
     """
-    def __init__(self, players: list, difficulty: int):
+    def __init__(self, players: list, difficulty: int, word_set: WordSet = None):
         """
         Creates blank version of unstarted game with a dictionary of all japanese words based on
         kana spelling and list of all valid kana patterns based on difficulty
 
         :param players: list Player objects of all players (used for console/testing)
         :param difficulty: difficulty of game (1 = easy, 2 = med, 3 = hard, 4 = practice)
+        :param word_set: version of dictionary and patterns to use (defaults to current version)
         """
         if difficulty > 4 or difficulty < 1:
             raise ValueError("Value must be between 1, 4 inclusive")
         
         self.players = players
-        with open("jp_dict.pkl", "rb") as f:
-            self.dictionary = pickle.load(f)
-
-        if difficulty != 4:
-            with open(f"patterns{difficulty}.pkl", "rb") as f:
-                self.patterns = pickle.load(f)
-        else:
-            with open(f"patterns1.pkl", "rb") as f:
-                self.patterns = pickle.load(f)
+        self.difficulty = difficulty
+        self.use_word_set(word_set or current_word_set())
 
         self.turn_index = 0
         self.time_limit = 3
@@ -76,15 +76,24 @@ class Game:
         self.last_error = ""
         self.winner = None
         self.queue = []
+        self.clock = time.time
+
 
+    def use_word_set(self, word_set: WordSet):
+        """
+        Switches game to given version of dictionary and patterns
+        """
+        self.word_set = word_set
+        self.dictionary = word_set.dictionary
+        self.patterns = word_set.patterns[1 if self.difficulty == 4 else self.difficulty]
 
     def get_player(self) -> Player:
         return self.players[self.turn_index]
 
     def time_elapsed(self) -> float:
-        if not self.turn_start_time:
+        if self.turn_start_time is None:
             return self.time_limit
-        return max(0, self.time_limit - (time.time() - self.turn_start_time))
+        return max(0, self.time_limit - (self.clock() - self.turn_start_time))
 
     def is_turn_expired(self) -> bool:
         return self.time_elapsed() > self.time_limit
@@ -111,7 +120,7 @@ class Game:
                 if player.is_eliminated == False:
                     print(f"{player.id} is the winner!")
                     return player
-        self.turn_start_time = time.time()
+        self.turn_start_time = self.clock()
         self.wrong_guesses += 1
         if self.wrong_guesses > self.wrong_turns_before_change:
             self.current_pattern = self.generate_pattern()
@@ -323,6 +332,7 @@ class Game:
         self.wrong_guesses = -1
     
     def restart_game(self):
+        self.use_word_set(current_word_set())
         self.players = self.players + self.queue
         for p in self.players:
             p.lives = self.starting_lives
@@ -352,7 +362,7 @@ class Game:
         if self.wrong_guesses > self.wrong_turns_before_change:
             self.current_pattern = self.generate_pattern()
             self.wrong_guesses = 0
-        self.turn_start_time = time.time()
+        self.turn_start_time = self.clock()
 
     def change_settings(self, settings: dict):
         """
@@ -365,13 +375,11 @@ class Game:
         self.wrong_turns_before_change = settings.get("turns")
         difficulty = settings.get("diff")
         if difficulty == "medium":
-            with open(f"patterns2.pkl", "rb") as f:
-                self.patterns = pickle.load(f)
+            self.difficulty = 2
         elif difficulty == "hard":
-            with open(f"patterns3.pkl", "rb") as f:
-                self.patterns = pickle.load(f)
+            self.difficulty = 3
         else:
-            with open(f"patterns1.pkl", "rb") as f:
-                self.patterns = pickle.load(f)
+            self.difficulty = 1
+        self.patterns = self.word_set.patterns[self.difficulty]
 
     
\ No newline at end of file
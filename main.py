@@ -1,4 +1,4 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Header
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -7,16 +7,20 @@ from contextlib import asynccontextmanager
 
 import os
 import random
+import secrets
 import string
 import time
 import asyncio
+from collections import deque
 
 from game import Game
 from player import Player
+from word_set import current_word_set, live_word_sets, load_word_set, publish
 
 # LOBBY LIFESPAN
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    await asyncio.to_thread(current_word_set)  # load words before first lobby
     cleanup_task = asyncio.create_task(cleanup_lobbies())
     try:
         yield
@@ -30,6 +34,9 @@ async def lifespan(app: FastAPI):
 app = FastAPI(lifespan=lifespan)
 
 lobbies = {}
+REPLAY_BUFFER = 64  # recent frames kept per lobby for reconnecting clients
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")  # admin endpoints disabled if not set
+reload_lock = asyncio.Lock()
 
 
 async def handle_message(ws, data, lobby):
@@ -93,6 +100,7 @@ async def handle_message(ws, data, lobby):
         if device_id in device_map:
             player = device_map[device_id]
             connections[ws] = player  # bind new socket
+        await replay_frames(ws, lobby, data.get("last_seq"))
         await broadcast_state(lobby)
     
     # TIMEOUT
@@ -143,7 +151,7 @@ async def handle_message(ws, data, lobby):
     
     # REQUEST STATE
     elif data["type"] == "request_state":
-        await ws.send_json(game.serialize())
+        await replay_frames(ws, lobby, data.get("last_seq"))
 
 # WEBSOCKET CREATION
 @app.websocket("/ws/{lobby_code}")
@@ -152,7 +160,7 @@ async def websocket_endpoint(ws: WebSocket, lobby_code: str):
     await ws.accept()
     lobby = lobbies.get(lobby_code)
     if not lobby:
-        await ws.close()
+        await ws.close(code=4404)  # unknown lobby, client stops reconnecting
         return
 
     lobby["clients"].append(ws)
@@ -182,7 +190,7 @@ async def broadcast_state(lobby):
     """
     Gives current state of the game to all players webpage.
     """
-    state = lobby["game"].serialize()
+    state = stamp_frame(lobby, lobby["game"].serialize())
     disconnected = []
 
     for client in lobby["clients"]:
@@ -197,6 +205,7 @@ async def broadcast_state(lobby):
 
 # RETURN TO LOBBY SCREEN
 async def broadcast_to_lobby(lobby, message):
+    message = stamp_frame(lobby, message)
     disconnected = []
     for client in lobby["clients"]:
         try:
@@ -208,6 +217,30 @@ async def broadcast_to_lobby(lobby, message):
     for client in disconnected:
         handle_disconnect(client, lobby)
 
+# SEQUENCE NUMBER FOR OUTBOUND FRAMES
+def stamp_frame(lobby, message):
+    """
+    Gives message the lobby's next sequence number and keeps it in the replay buffer.
+    """
+    lobby["seq"] += 1
+    frame = {**message, "seq": lobby["seq"]}
+    lobby["history"].append(frame)
+    return frame
+
+# SEND MISSED FRAMES TO RECONNECTING CLIENT
+async def replay_frames(ws, lobby, last_seq):
+    """
+    Sends the frames a client missed after last_seq. If they're no longer all in the
+    replay buffer (or client has no last_seq), sends one snapshot of the game instead.
+    """
+    if isinstance(last_seq, int) and 0 <= last_seq <= lobby["seq"]:
+        missed = [frame for frame in lobby["history"] if frame["seq"] > last_seq]
+        if len(missed) == lobby["seq"] - last_seq:
+            for frame in missed:
+                await ws.send_json(frame)
+            return
+    await ws.send_json({**lobby["game"].serialize(), "seq": lobby["seq"]})
+
 # NOT USED RN
 async def cleanup_sockets(lobby):
     connections = lobby["connections"]
@@ -250,7 +283,9 @@ def create_lobby():
         "connections": {},
         "device_map": {},
         "code" : code,
-        "last_active": time.time()
+        "last_active": time.time(),
+        "seq": 0,
+        "history": deque(maxlen=REPLAY_BUFFER)
     }
     return {"code": code}
 
@@ -269,6 +304,43 @@ def check_lobby(code: str):
         return {"valid": True}
     return {"valid": False}
 
+# --------ADMIN: HOT RELOAD DICTIONARY AND PATTERNS------
+def check_admin(token: str):
+    if not ADMIN_TOKEN or not secrets.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+@app.post("/admin/reload_words")
+async def reload_words(x_admin_token: str = Header("")):
+    """
+    Loads and validates the word list and patterns in a worker thread, then swaps them in.
+    Running games switch on their next restart, new lobbies use the new version.
+    """
+    check_admin(x_admin_token)
+    async with reload_lock:
+        try:
+            word_set = await asyncio.to_thread(load_word_set)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Reload failed: {e}")
+        publish(word_set)
+    print(f"📚 Word set v{word_set.version} loaded in {word_set.load_time:.2f}s")
+    return word_set.info()
+
+@app.get("/admin/word_sets")
+def word_sets(x_admin_token: str = Header("")):
+    """
+    Load time, memory and lobby count of every version still in use
+    """
+    check_admin(x_admin_token)
+    current = current_word_set()
+    in_use = {}
+    for lobby in list(lobbies.values()):
+        version = lobby["game"].word_set.version
+        in_use[version] = in_use.get(version, 0) + 1
+    return [
+        {**ws.info(), "current": ws is current, "lobbies": in_use.get(ws.version, 0)}
+        for ws in live_word_sets()
+    ]
+
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
@@ -0,0 +1,359 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from game import Game
+from player import Player
+
+DIFFICULTIES = {"easy": 1, "medium": 2, "hard": 3}
+
+
+class VirtualClock:
+    """
+    Stand-in for time.time() so simulated turns don't wait on the wall clock
+
+    Attributes
+    ----------
+    now : float
+        current virtual time in seconds
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class PlayerModel:
+    """
+    Models how a simulated player answers a pattern. Patterns with fewer words containing
+    them are harder: accuracy drops and latency rises (up to double) on a log scale of
+    solutions, reaching the base values at easy_solutions words.
+
+    Attributes
+    ----------
+    accuracy : float
+        chance of knowing a valid word for an easy pattern
+    latency : float
+        average seconds taken to submit a word for an easy pattern
+    latency_spread : float
+        standard deviation of latency
+    easy_solutions : int
+        words a pattern needs to be answered at base accuracy and latency
+    pattern_accuracy : dict
+        pattern to accuracy, overrides the scaled accuracy for that pattern
+    pattern_latency : dict
+        pattern to average latency, overrides the scaled latency for that pattern
+    """
+    def __init__(self, accuracy: float = 0.8, latency: float = 1.5, latency_spread: float = 0.5,
+                 easy_solutions: int = 1000, pattern_accuracy: dict = None, pattern_latency: dict = None):
+        self.accuracy = accuracy
+        self.latency = latency
+        self.latency_spread = latency_spread
+        self.easy_solutions = easy_solutions
+        self.pattern_accuracy = pattern_accuracy or {}
+        self.pattern_latency = pattern_latency or {}
+
+    def ease(self, solutions: int) -> float:
+        """
+        How easy a pattern is from 0 (no solutions) to 1 (easy_solutions or more)
+        """
+        return min(1.0, math.log1p(solutions) / math.log1p(max(self.easy_solutions, 1)))
+
+    def answer(self, pattern: str, solutions: int) -> tuple:
+        """
+        Decides if player answers the pattern and how long it takes
+
+        :param pattern: current kana pattern
+        :param solutions: amount of words containing pattern
+        :return: (knows a word, seconds taken)
+        """
+        ease = self.ease(solutions)
+        accuracy = self.pattern_accuracy.get(pattern, self.accuracy * ease)
+        latency = self.pattern_latency.get(pattern, self.latency * (2 - ease))
+        knows = random.random() < accuracy
+        return knows, max(0.0, random.gauss(latency, self.latency_spread))
+
+
+# ---------------- WORKER PROCESS ---------------- #
+# Loaded once per worker and reused by every batch it runs
+_games = {}
+_word_index = {}
+
+
+def worker_game(settings: dict) -> Game:
+    """
+    Gets this worker's Game for the settings' difficulty and applies the rest of the settings
+
+    :param settings: keys: lives, time, turns, diff
+    :return: Game ready to be restarted
+    """
+    diff = settings["diff"]
+    if diff not in _games:
+        _games[diff] = Game([], DIFFICULTIES[diff])
+    game = _games[diff]
+    game.starting_lives = settings["lives"]
+    game.time_limit = settings["time"]
+    game.wrong_turns_before_change = settings["turns"]
+    return game
+
+
+def words_for(game: Game, pattern: str) -> list:
+    """
+    All dictionary words containing pattern (cached per worker)
+    """
+    if pattern not in _word_index:
+        _word_index[pattern] = [w for words in game.dictionary.values() for w in words if pattern in w]
+    return _word_index[pattern]
+
+
+def find_word(game: Game, pattern: str) -> str:
+    """
+    Picks a random unused word containing pattern
+
+    :return: word or None if pattern has no unused words left
+    """
+    words = words_for(game, pattern)
+    if not words:
+        return None
+    start = random.randrange(len(words))
+    for i in range(len(words)):
+        word = words[(start + i) % len(words)]
+        if word not in game.used_words:
+            return word
+    return None
+
+
+def play_game(game: Game, models: list, max_turns: int, stats: dict):
+    """
+    Plays one game to the end, following the same turn flow as the web game in main.py.
+    Players answer on the game's clock, and a turn counts as answered in time only if
+    game.time_elapsed() still has time left. Otherwise it's treated like a "timeout" message.
+    Elimination follows the web game too: a player at 0 lives keeps getting turns until
+    Player.lose_life marks them eliminated on their next timeout. An elimination is recorded
+    when that happens, or when the game ends with the player still at 0 lives.
+
+    :param models: PlayerModel for each seat
+    :param max_turns: turns before game is cut off
+    :param stats: batch stats to add results to
+    """
+    clock = VirtualClock()
+    game.clock = clock
+    game.players = [Player(f"bot{i}", f"bot{i}") for i in range(len(models))]
+    game.queue = []
+    game.game_active = False
+    game.restart_game()
+
+    turns = 0
+    eliminated = 0
+    while game.check_winner() is None and turns < max_turns:
+        turns += 1
+        pattern = game.current_pattern
+        solutions = game.word_set.solution_counts.get(pattern, 0)
+        knows, latency = models[game.turn_index].answer(pattern, solutions)
+        turn_end = game.turn_start_time + game.time_limit
+        clock.advance(latency if knows else game.time_limit)
+        word = find_word(game, pattern) if knows and game.time_elapsed() > 0 else None
+        stats["attempts"][pattern] += 1
+
+        # SUBMIT
+        if word is not None and game.submit_word(word) == "OK":
+            game.next_turn()
+            continue
+
+        # TIMEOUT
+        clock.now = turn_end
+        stats["stalls"][pattern] += 1
+        player = game.get_player()
+        player.lose_life()
+        if player.is_eliminated:
+            eliminated += 1
+            stats["elimination_turns"][eliminated] += turns
+            stats["eliminations"][eliminated] += 1
+        if game.check_winner() is None:
+            game.next_turn()
+
+    # Players out of lives when game ended but never marked eliminated
+    for player in game.players:
+        if player.lives <= 0 and not player.is_eliminated:
+            eliminated += 1
+            stats["elimination_turns"][eliminated] += turns
+            stats["eliminations"][eliminated] += 1
+
+    game.game_active = False
+    stats["games"] += 1
+    stats["lengths"][turns] += 1
+    stats["seconds"] += clock.now
+    if turns >= max_turns:
+        stats["capped"] += 1
+
+
+def new_stats() -> dict:
+    return {
+        "games": 0,
+        "capped": 0,
+        "seconds": 0.0,
+        "lengths": Counter(),
+        "eliminations": Counter(),
+        "elimination_turns": Counter(),
+        "attempts": Counter(),
+        "stalls": Counter(),
+    }
+
+
+def merge_stats(total: dict, stats: dict):
+    for key, value in stats.items():
+        if isinstance(value, Counter):
+            total[key].update(value)
+        else:
+            total[key] += value
+
+
+def run_batch(settings: dict, models: list, games: int, seed: str, max_turns: int) -> dict:
+    """
+    Plays a batch of games for one settings combination (runs inside a worker process)
+
+    :param seed: seed for this batch so runs can be repeated
+    :return: batch stats
+    """
+    random.seed(seed)
+    game = worker_game(settings)
+    stats = new_stats()
+    for _ in range(games):
+        play_game(game, models, max_turns, stats)
+    return stats
+
+
+# ---------------- DRIVER ---------------- #
+def simulate(grid: list, models: list, games: int, batch_size: int = 10000,
+             workers: int = None, seed: int = 0, max_turns: int = 1000) -> list:
+    """
+    Runs games for every settings combination across a process pool
+
+    :param grid: list of settings dicts (keys: lives, time, turns, diff)
+    :param models: PlayerModel for each seat
+    :param games: games to play per settings combination
+    :return: list of (settings, stats) in grid order
+    """
+    if not models:
+        raise ValueError("Need at least 1 player model")
+    results = [new_stats() for _ in grid]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for i, settings in enumerate(grid):
+            for b, start in enumerate(range(0, games, batch_size)):
+                n = min(batch_size, games - start)
+                future = pool.submit(run_batch, settings, models, n, f"{seed}-{i}-{b}", max_turns)
+                futures[future] = i
+        for future in as_completed(futures):
+            merge_stats(results[futures[future]], future.result())
+    return list(zip(grid, results))
+
+
+def percentile(counts: Counter, pct: float) -> int:
+    target = sum(counts.values()) * pct
+    seen = 0
+    for value in sorted(counts):
+        seen += counts[value]
+        if seen >= target:
+            return value
+    return 0
+
+
+def report(settings: dict, stats: dict, worst: int = 5, min_attempts: int = 30) -> str:
+    """
+    Formats stats for one settings combination
+
+    :param worst: amount of patterns to list with highest stall rate
+    :param min_attempts: turns a pattern needs before it can be listed as worst
+    """
+    games = max(stats["games"], 1)
+    lengths = stats["lengths"]
+    mean_turns = sum(t * n for t, n in lengths.items()) / games
+    lines = [
+        f"time={settings['time']} lives={settings['lives']} turns={settings['turns']} "
+        f"diff={settings['diff']}  games={stats['games']}",
+        f"  length: mean {mean_turns:.1f} turns ({stats['seconds'] / games:.1f}s), "
+        f"p50 {percentile(lengths, 0.5)}, p90 {percentile(lengths, 0.9)}, "
+        f"p99 {percentile(lengths, 0.99)}, capped {stats['capped']}",
+    ]
+
+    curve = [
+        f"#{k} @ {stats['elimination_turns'][k] / stats['eliminations'][k]:.1f}"
+        for k in sorted(stats["eliminations"])
+    ]
+    lines.append("  eliminations (mean turn): " + (", ".join(curve) or "none"))
+
+    attempts = stats["attempts"]
+    stalls = stats["stalls"]
+    total = sum(attempts.values())
+    sampled = [p for p in attempts if attempts[p] >= min_attempts]
+    rates = sorted(sampled, key=lambda p: stalls[p] / attempts[p], reverse=True)[:worst]
+    lines.append(f"  stalls: overall {100 * sum(stalls.values()) / max(total, 1):.1f}%; worst: " + (", ".join(
+        f"{p} {100 * stalls[p] / attempts[p]:.1f}% ({stalls[p]}/{attempts[p]})" for p in rates
+    ) or f"none with {min_attempts}+ turns"))
+    return "\n".join(lines)
+
+
+def load_models(path: str) -> list:
+    """
+    Loads player models from a json list of PlayerModel keyword arguments
+    """
+    with open(path, encoding="utf-8") as f:
+        return [PlayerModel(**kwargs) for kwargs in json.load(f)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Japanese Word Bomb simulator")
+    parser.add_argument("--games", type=int, default=10000, help="games per settings combination")
+    parser.add_argument("--time", type=float, nargs="+", default=[3])
+    parser.add_argument("--lives", type=int, nargs="+", default=[3])
+    parser.add_argument("--turns", type=int, nargs="+", default=[2])
+    parser.add_argument("--diff", nargs="+", default=["easy"], choices=list(DIFFICULTIES))
+    parser.add_argument("--players", type=int, default=4, help="seats when --models isn't given")
+    parser.add_argument("--accuracy", type=float, default=0.8)
+    parser.add_argument("--latency", type=float, default=1.5)
+    parser.add_argument("--spread", type=float, default=0.5)
+    parser.add_argument("--easy-solutions", type=int, default=1000,
+                        help="words a pattern needs to be answered at --accuracy/--latency")
+    parser.add_argument("--models", help="json file with a list of PlayerModel settings")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--min-attempts", type=int, default=30, help="turns a pattern needs to be listed in worst stalls")
+    args = parser.parse_args()
+    if not args.models and args.players < 1:
+        parser.error("--players must be at least 1")
+
+    if args.models:
+        models = load_models(args.models)
+        if not models:
+            parser.error("--models file has no players")
+    else:
+        models = [PlayerModel(args.accuracy, args.latency, args.spread, args.easy_solutions) for _ in range(args.players)]
+
+    grid = [
+        {"time": t, "lives": l, "turns": w, "diff": d}
+        for t, l, w, d in itertools.product(args.time, args.lives, args.turns, args.diff)
+    ]
+    results = simulate(grid, models, args.games, args.batch_size, args.workers, args.seed, args.max_turns)
+    for settings, stats in results:
+        print(report(settings, stats, min_attempts=args.min_attempts) + "\n")
+
+
+if __name__ == "__main__":
+    main()
+
+
+"""
+python simulate.py --games 1000000 --time 3 5 --lives 2 3 --turns 1 2 --diff easy hard
+"""
@@ -7,7 +7,7 @@ if (!lobbyCode) {
 }
 
 const protocol = window.location.protocol === "https:" ? "wss" : "ws";
-const ws = new WebSocket(`${protocol}://${window.location.host}/ws/${lobbyCode}`);
+let ws = null;
 
 // Retrieve stored player identity
 const playerName = localStorage.getItem("playerName");
@@ -17,6 +17,8 @@ const localDeviceId = localStorage.getItem("device_id");
 let currentState = null;
 let lastUpdate = null;
 let host_id = null;
+let lastSeq = null; // sequence number of last frame from server
+let retries = 0; // reconnect attempts since last successful open
 
 // LANG SWITCHER
 let lang = localStorage.getItem("lang");
@@ -35,21 +37,51 @@ window.onload = () => {
     if (input) input.focus();
 };
 
+// OPENS SOCKET, REOPENS IT IF CONNECTION DROPS
+function connect() {
+    ws = new WebSocket(`${protocol}://${window.location.host}/ws/${lobbyCode}`);
+    ws.onopen = onOpen;
+    ws.onmessage = onMessage;
+    ws.onclose = onClose;
+}
+
+function onClose(event) {
+    // Lobby no longer exists, go back to main menu
+    if (event.code === 4404) {
+        window.location.href = "/";
+        return;
+    }
+    // Back off 1s, 2s, 4s... up to 30s
+    const delay = Math.min(1000 * 2 ** retries, 30000);
+    retries++;
+    setTimeout(connect, delay);
+}
+
+// SENDS MESSAGE IF SOCKET IS OPEN, returns false if it couldn't be sent
+function send(message) {
+    if (!ws || ws.readyState !== WebSocket.OPEN) return false;
+    ws.send(JSON.stringify(message));
+    return true;
+}
+
 // RECONNECTS PALYER AFTER STARTING
-ws.onopen = () => {
+// last_seq lets server replay only the frames missed while disconnected
+function onOpen() {
+    retries = 0;
     if (playerName) {
         ws.send(JSON.stringify({
             type: "reconnect",
             name: playerName,
-            device_id: localDeviceId
+            device_id: localDeviceId,
+            last_seq: lastSeq
         }));
+    } else {
+        ws.send(JSON.stringify({ type: "request_state", last_seq: lastSeq }));
     }
-    ws.send(JSON.stringify({ type: "request_state" }));
-};
+}
 
-ws.onmessage = (event) => {
+function onMessage(event) {
     const state = JSON.parse(event.data);
-    host_id = state.host_id;
 
     if (state.type == "force_return_to_lobby") {
         console.log("MESSAGE REACHED")
@@ -57,6 +89,11 @@ ws.onmessage = (event) => {
         return;
     }
 
+    // Skip frames already seen or older than current state
+    if (lastSeq !== null && state.seq <= lastSeq) return;
+    lastSeq = state.seq;
+    host_id = state.host_id;
+
     // Store latest state
     currentState = state;
     lastUpdate = Date.now();
@@ -80,7 +117,9 @@ ws.onmessage = (event) => {
         window.gameEnded = true;
         return;
     }
-};
+}
+
+connect();
 
 function updateUI(state) {
     // CURRENT PLAYER
@@ -140,9 +179,9 @@ setInterval(() => {
     if (timerEl) timerEl.innerText = remaining.toFixed(1);
 
     // Auto-submit timeout when time runs out
+    // (retried next tick if socket is reconnecting)
     if (remaining <= 0 && !currentState.time_expired) {
-        ws.send(JSON.stringify({ type: "timeout" }));
-        currentState.time_expired = true;
+        currentState.time_expired = send({ type: "timeout" });
     }
 }, 100);
 
@@ -152,14 +191,12 @@ function submitWord() {
     const word = input.value.trim();
     if (!word) return;
 
-    ws.send(JSON.stringify({ type: "submit", word }));
-    input.value = "";
+    if (send({ type: "submit", word })) input.value = "";
 }
 
 // RESTART GAME
 function restartGame() {
-    if (host_id === localDeviceId) {
-        ws.send(JSON.stringify({ type: "restart" }));
+    if (host_id === localDeviceId && send({ type: "restart" })) {
         window.gameEnded = false;
         document.getElementById("game-over").style.display = "none";
         document.getElementById("word").disabled = false;
@@ -168,11 +205,10 @@ function restartGame() {
 
 // LOBBY SCREEN
 function returnToLobby() {
-    if (host_id === localDeviceId) {
+    if (host_id === localDeviceId && send({ type: "return_to_lobby" })) {
         let settings = localStorage.getItem("gameSettings");
         localStorage.clear()
         localStorage.setItem("lang", lang)
         localStorage.setItem("gameSettings", settings);
-        ws.send(JSON.stringify({ type: "return_to_lobby" }));
     }
 }
\ No newline at end of file
@@ -0,0 +1,154 @@
+import itertools
+import pickle
+import sys
+import threading
+import time
+import weakref
+from collections import Counter
+
+_versions = itertools.count(1)
+_live = weakref.WeakValueDictionary()  # version -> WordSet, drops out once nothing references it
+_current = None
+_lock = threading.RLock()
+
+
+class WordSet:
+    """
+    One loaded version of the dictionary and pattern sets. Games hold a reference to the
+    version they started on, so a version is freed once no game uses it.
+
+    Attributes
+    ----------
+    version : int
+        increasing version number (None until published)
+    dictionary : dictionary
+        dictionary of starting kana to all valid words starting with kana
+    patterns : dictionary
+        difficulty (1 = easy, 2 = med, 3 = hard) to list of kana patterns
+    solution_counts : dictionary
+        pattern to amount of words containing it
+    load_time : float
+        seconds taken to load and validate
+    memory : int
+        estimated bytes used by dictionary, patterns and indexes
+    loaded_at : float
+        global time version was loaded
+    """
+    def __init__(self, dictionary: dict, patterns: dict):
+        self.version = None
+        self.dictionary = dictionary
+        self.patterns = patterns
+        self.solution_counts = count_solutions(dictionary, patterns)
+        self.load_time = 0.0
+        self.memory = 0
+        self.loaded_at = time.time()
+
+    def validate(self):
+        """
+        Checks word set can be played. Raises ValueError if not
+        """
+        if not self.dictionary:
+            raise ValueError("Dictionary is empty")
+        for difficulty, patterns in self.patterns.items():
+            if not patterns:
+                raise ValueError(f"patterns{difficulty} is empty")
+        unsolvable = [p for p, count in self.solution_counts.items() if count == 0]
+        if unsolvable:
+            raise ValueError(f"{len(unsolvable)} patterns have no solutions: {unsolvable[:10]}")
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "load_time": self.load_time,
+            "memory": self.memory,
+            "words": sum(len(words) for words in self.dictionary.values()),
+            "patterns": {d: len(p) for d, p in self.patterns.items()},
+        }
+
+
+def count_solutions(dictionary: dict, patterns: dict) -> dict:
+    """
+    Counts words containing each pattern
+
+    :return: pattern to amount of words
+    """
+    all_patterns = set(itertools.chain.from_iterable(patterns.values()))
+    lengths = {len(p) for p in all_patterns}
+    counts = Counter()
+    for words in dictionary.values():
+        for w in words:
+            subs = {w[i:i + n] for n in lengths for i in range(len(w) - n + 1)}
+            counts.update(subs & all_patterns)
+    return {p: counts[p] for p in all_patterns}
+
+
+def deep_size(obj, seen: set = None) -> int:
+    """
+    Estimated bytes used by obj and the containers/strings inside it
+
+    :param seen: ids of objects already counted (share it across calls so objects
+        reachable from several places are only counted once)
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_size(x, seen) for x in obj)
+    return size
+
+
+def load_word_set() -> WordSet:
+    """
+    Loads and validates a new version from jp_dict.pkl and patterns1/2/3.pkl.
+    Slow, so run it off the event loop.
+
+    :return: new WordSet (not yet current)
+    """
+    start = time.perf_counter()
+    with open("jp_dict.pkl", "rb") as f:
+        dictionary = pickle.load(f)
+    patterns = {}
+    for difficulty in (1, 2, 3):
+        with open(f"patterns{difficulty}.pkl", "rb") as f:
+            patterns[difficulty] = list(pickle.load(f))
+
+    word_set = WordSet(dictionary, patterns)
+    word_set.validate()
+    seen = set()
+    word_set.memory = sum(deep_size(obj, seen) for obj in (dictionary, patterns, word_set.solution_counts))
+    word_set.load_time = time.perf_counter() - start
+    return word_set
+
+
+def current_word_set() -> WordSet:
+    """
+    Version new games should use. Loads the first version if none loaded yet
+    """
+    with _lock:
+        if _current is None:
+            publish(load_word_set())
+        return _current
+
+
+def publish(word_set: WordSet):
+    """
+    Numbers word_set and makes it the current version. Games already running keep their version.
+    """
+    global _current
+    with _lock:
+        word_set.version = next(_versions)
+        _live[word_set.version] = word_set
+        _current = word_set
+
+
+def live_word_sets() -> list:
+    """
+    All versions still referenced somewhere, oldest first
+    """
+    return [word_set for _, word_set in sorted(_live.items())]